@@ -14,27 +14,370 @@ import threading
 import traceback
 from datetime import datetime
 import unicodedata
+import importlib.util
+import csv
+import json
+import html
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
 
-# 第三方库导入检查
-try:
-    from fontTools.ttLib import TTFont
-    FONTTOOLS_AVAILABLE = True
-except ImportError:
-    FONTTOOLS_AVAILABLE = False
+# 第三方库检查：这里只确认是否已安装，实际导入推迟到首次使用时，避免拖慢界面启动
+FONTTOOLS_AVAILABLE = importlib.util.find_spec("fontTools") is not None
+if not FONTTOOLS_AVAILABLE:
     print("警告: fontTools库未安装，请运行: pip install fonttools")
 
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
-    print("警告: pandas库未安装，请运行: pip install pandas")
+PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None  # 非必需，仅用于缺少openpyxl时导出.xls
+OPENPYXL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None  # 非必需，仅用于Excel格式
+
+# Unicode区块范围定义（简化版，常用区块）
+_UNICODE_BLOCKS = sorted([
+    (0x0000, 0x007F, "基本拉丁文"),
+    (0x0080, 0x00FF, "拉丁文补充-1"),
+    (0x0100, 0x017F, "拉丁文扩展-A"),
+    (0x0180, 0x024F, "拉丁文扩展-B"),
+    (0x0370, 0x03FF, "希腊文及科普特文"),
+    (0x0400, 0x04FF, "西里尔文"),
+    (0x0500, 0x052F, "西里尔文补充"),
+    (0x0530, 0x058F, "亚美尼亚文"),
+    (0x0590, 0x05FF, "希伯来文"),
+    (0x0600, 0x06FF, "阿拉伯文"),
+    (0x0700, 0x074F, "叙利亚文"),
+    (0x0750, 0x077F, "阿拉伯文补充"),
+    (0x0780, 0x07BF, "它拿文"),
+    (0x0800, 0x083F, "撒马利亚文"),
+    (0x0840, 0x085F, "曼达文"),
+    (0x0860, 0x086F, "叙利亚文补充"),
+    (0x08A0, 0x08FF, "阿拉伯文扩展-A"),
+    (0x0900, 0x097F, "天城文"),
+    (0x0980, 0x09FF, "孟加拉文"),
+    (0x0A00, 0x0A7F, "古木基文"),
+    (0x0A80, 0x0AFF, "古吉拉特文"),
+    (0x0B00, 0x0B7F, "奥里亚文"),
+    (0x0B80, 0x0BFF, "泰米尔文"),
+    (0x0C00, 0x0C7F, "泰卢固文"),
+    (0x0C80, 0x0CFF, "卡纳达文"),
+    (0x0D00, 0x0D7F, "马拉雅拉姆文"),
+    (0x0D80, 0x0DFF, "僧伽罗文"),
+    (0x0E00, 0x0E7F, "泰文"),
+    (0x0E80, 0x0EFF, "老挝文"),
+    (0x0F00, 0x0FFF, "藏文"),
+    (0x1000, 0x109F, "缅甸文"),
+    (0x10A0, 0x10FF, "格鲁吉亚文"),
+    (0x1100, 0x11FF, "谚文兼容字母"),
+    (0x1200, 0x137F, "埃塞俄比亚文"),
+    (0x1380, 0x139F, "埃塞俄比亚文补充"),
+    (0x13A0, 0x13FF, "切罗基文"),
+    (0x1400, 0x167F, "统一加拿大原住民音节文字"),
+    (0x1680, 0x169F, "欧甘文"),
+    (0x16A0, 0x16FF, "如尼文"),
+    (0x1700, 0x171F, "塔加拉文"),
+    (0x1720, 0x173F, "哈努诺文"),
+    (0x1740, 0x175F, "布希德文"),
+    (0x1760, 0x177F, "塔格班瓦文"),
+    (0x1780, 0x17FF, "高棉文"),
+    (0x1800, 0x18AF, "蒙古文"),
+    (0x18B0, 0x18FF, "统一加拿大原住民音节文字扩展"),
+    (0x1900, 0x194F, "林布文"),
+    (0x1950, 0x197F, "德宏傣文"),
+    (0x1980, 0x19DF, "新傣仂文"),
+    (0x19E0, 0x19FF, "高棉符号"),
+    (0x1A00, 0x1A1F, "布吉文"),
+    (0x1A20, 0x1AAF, "兰纳文"),
+    (0x1AB0, 0x1AFF, "组合变音标记扩展"),
+    (0x1B00, 0x1B7F, "巴厘文"),
+    (0x1B80, 0x1BBF, "巽他文"),
+    (0x1BC0, 0x1BFF, "巴塔克文"),
+    (0x1C00, 0x1C4F, "雷布查文"),
+    (0x1C50, 0x1C7F, "桑塔利文"),
+    (0x1C80, 0x1C8F, "西里尔文扩展-C"),
+    (0x1C90, 0x1CBF, "格鲁吉亚文扩展"),
+    (0x1CC0, 0x1CCF, "巽他文补充"),
+    (0x1CD0, 0x1CFF, "吠陀扩展"),
+    (0x1D00, 0x1D7F, "音标扩展"),
+    (0x1D80, 0x1DBF, "音标扩展补充"),
+    (0x1DC0, 0x1DFF, "组合变音标记补充"),
+    (0x1E00, 0x1EFF, "拉丁文扩展附加"),
+    (0x1F00, 0x1FFF, "希腊文扩展"),
+    (0x2000, 0x206F, "常用标点"),
+    (0x2070, 0x209F, "上标和下标"),
+    (0x20A0, 0x20CF, "货币符号"),
+    (0x20D0, 0x20FF, "组合用符号"),
+    (0x2100, 0x214F, "字母式符号"),
+    (0x2150, 0x218F, "数字形式"),
+    (0x2190, 0x21FF, "箭头"),
+    (0x2200, 0x22FF, "数学运算符"),
+    (0x2300, 0x23FF, "杂项技术符号"),
+    (0x2400, 0x243F, "控制图片"),
+    (0x2440, 0x245F, "光学识别符"),
+    (0x2460, 0x24FF, "带圈字母数字"),
+    (0x2500, 0x257F, "制表符"),
+    (0x2580, 0x259F, "方块元素"),
+    (0x25A0, 0x25FF, "几何图形"),
+    (0x2600, 0x26FF, "杂项符号"),
+    (0x2700, 0x27BF, "印刷符号"),
+    (0x27C0, 0x27EF, "杂项数学符号-A"),
+    (0x27F0, 0x27FF, "补充箭头-A"),
+    (0x2800, 0x28FF, "盲文点字模型"),
+    (0x2900, 0x297F, "补充箭头-B"),
+    (0x2980, 0x29FF, "杂项数学符号-B"),
+    (0x2A00, 0x2AFF, "补充数学运算符"),
+    (0x2B00, 0x2BFF, "杂项符号和箭头"),
+    (0x2C00, 0x2C5F, "格拉哥里文"),
+    (0x2C60, 0x2C7F, "拉丁文扩展-C"),
+    (0x2C80, 0x2CFF, "科普特文"),
+    (0x2D00, 0x2D2F, "格鲁吉亚文补充"),
+    (0x2D30, 0x2D7F, "提非纳文"),
+    (0x2D80, 0x2DDF, "埃塞俄比亚文扩展"),
+    (0x2DE0, 0x2DFF, "西里尔文扩展-A"),
+    (0x2E00, 0x2E7F, "补充标点"),
+    (0x2E80, 0x2EFF, "中日韩汉字部首补充"),
+    (0x2F00, 0x2FDF, "康熙部首"),
+    (0x2FF0, 0x2FFF, "表意文字描述字符"),
+    (0x3000, 0x303F, "中日韩符号和标点"),
+    (0x3040, 0x309F, "日文平假名"),
+    (0x30A0, 0x30FF, "日文片假名"),
+    (0x3100, 0x312F, "注音字母"),
+    (0x3130, 0x318F, "谚文兼容字母"),
+    (0x3190, 0x319F, "汉文注释标志"),
+    (0x31A0, 0x31BF, "注音字母扩展"),
+    (0x31C0, 0x31EF, "中日韩笔画"),
+    (0x31F0, 0x31FF, "日文片假名拼音扩展"),
+    (0x3200, 0x32FF, "带圈中日韩字母和月份"),
+    (0x3300, 0x33FF, "中日韩兼容字符"),
+    (0x3400, 0x4DBF, "中日韩统一表意文字扩展A"),
+    (0x4DC0, 0x4DFF, "易经六十四卦符号"),
+    (0x4E00, 0x9FFF, "中日韩统一表意文字"),
+    (0xA000, 0xA48F, "彝文音节"),
+    (0xA490, 0xA4CF, "彝文字根"),
+    (0xA4D0, 0xA4FF, "老傈僳文"),
+    (0xA500, 0xA63F, "瓦伊文"),
+    (0xA640, 0xA69F, "西里尔文扩展-B"),
+    (0xA6A0, 0xA6FF, "巴穆姆文"),
+    (0xA700, 0xA71F, "声调修饰字母"),
+    (0xA720, 0xA7FF, "拉丁文扩展-D"),
+    (0xA800, 0xA82F, "锡尔赫特文"),
+    (0xA830, 0xA83F, "通用印度数字格式"),
+    (0xA840, 0xA87F, "八思巴文"),
+    (0xA880, 0xA8DF, "索拉什特拉文"),
+    (0xA8E0, 0xA8FF, "天城文扩展"),
+    (0xA900, 0xA92F, "克耶文"),
+    (0xA930, 0xA95F, "勒姜文"),
+    (0xA960, 0xA97F, "谚文扩展-A"),
+    (0xA980, 0xA9DF, "爪哇文"),
+    (0xA9E0, 0xA9FF, "缅甸文扩展-B"),
+    (0xAA00, 0xAA5F, "占文"),
+    (0xAA60, 0xAA7F, "缅甸文扩展-A"),
+    (0xAA80, 0xAADF, "越南傣文"),
+    (0xAAE0, 0xAAFF, "梅泰文扩展"),
+    (0xAB00, 0xAB2F, "埃塞俄比亚文扩展-A"),
+    (0xAB30, 0xAB6F, "拉丁文扩展-E"),
+    (0xAB70, 0xABBF, "切罗基文补充"),
+    (0xABC0, 0xABFF, "曼尼普尔文"),
+    (0xAC00, 0xD7AF, "谚文音节"),
+    (0xD7B0, 0xD7FF, "谚文字母扩展-B"),
+    (0xF900, 0xFAFF, "中日韩兼容表意文字"),
+    (0xFB00, 0xFB4F, "字母表达形式"),
+    (0xFB50, 0xFDFF, "阿拉伯表达形式-A"),
+    (0xFE00, 0xFE0F, "变体选择符"),
+    (0xFE10, 0xFE1F, "竖排形式"),
+    (0xFE20, 0xFE2F, "组合用半符号"),
+    (0xFE30, 0xFE4F, "中日韩兼容形式"),
+    (0xFE50, 0xFE6F, "小写变体形式"),
+    (0xFE70, 0xFEFF, "阿拉伯表达形式-B"),
+    (0xFF00, 0xFFEF, "半形及全形形式"),
+    (0xFFF0, 0xFFFF, "特殊"),
+    (0x10000, 0x1007F, "线性文字B音节文字"),
+    (0x10080, 0x100FF, "线性文字B表意文字"),
+    (0x10100, 0x1013F, "爱琴海数字"),
+    (0x10140, 0x1018F, "古希腊数字"),
+    (0x10190, 0x101CF, "古代符号"),
+    (0x101D0, 0x101FF, "费斯托斯圆盘"),
+    (0x10280, 0x1029F, "吕基亚文"),
+    (0x102A0, 0x102DF, "卡里亚文"),
+    (0x102E0, 0x102FF, "科普特历法"),
+    (0x10300, 0x1032F, "古意大利文"),
+    (0x10330, 0x1034F, "哥特文"),
+    (0x10350, 0x1037F, "古彼尔姆文"),
+    (0x10380, 0x1039F, "乌加里特文"),
+    (0x103A0, 0x103DF, "古波斯文"),
+    (0x10400, 0x1044F, "德瑟雷特文"),
+    (0x10450, 0x1047F, "肃伯纳文"),
+    (0x10480, 0x104AF, "奥斯曼亚文"),
+    (0x104B0, 0x104FF, "欧塞奇文"),
+    (0x10500, 0x1052F, "爱尔巴桑文"),
+    (0x10530, 0x1056F, "高加索阿尔巴尼亚文"),
+    (0x10600, 0x1077F, "线性文字A"),
+    (0x10800, 0x1083F, "塞浦路斯音节文字"),
+    (0x10840, 0x1085F, "帝国亚拉姆文"),
+    (0x10860, 0x1087F, "帕尔迈拉文"),
+    (0x10880, 0x108AF, "纳巴泰文"),
+    (0x108E0, 0x108FF, "哈特拉文"),
+    (0x10900, 0x1091F, "腓尼基文"),
+    (0x10920, 0x1093F, "吕底亚文"),
+    (0x10980, 0x1099F, "麦罗埃文圣书体"),
+    (0x109A0, 0x109FF, "麦罗埃文草书体"),
+    (0x10A00, 0x10A5F, "佉卢文"),
+    (0x10A60, 0x10A7F, "古南阿拉伯文"),
+    (0x10A80, 0x10A9F, "古北阿拉伯文"),
+    (0x10AC0, 0x10AFF, "曼尼安文"),
+    (0x10B00, 0x10B3F, "阿维斯陀文"),
+    (0x10B40, 0x10B5F, "碑铭帕提亚文"),
+    (0x10B60, 0x10B7F, "碑铭巴列维文"),
+    (0x10B80, 0x10BAF, "诗篇巴列维文"),
+    (0x10C00, 0x10C4F, "古突厥文"),
+    (0x10C80, 0x10CFF, "古匈牙利文"),
+    (0x10E60, 0x10E7F, "卢米符号数字"),
+    (0x11000, 0x1107F, "婆罗米文"),
+    (0x11080, 0x110CF, "凯提文"),
+    (0x110D0, 0x110FF, "索拉桑朋文"),
+    (0x11100, 0x1114F, "查克马文"),
+    (0x11150, 0x1117F, "马哈贾尼文"),
+    (0x11180, 0x111DF, "夏拉达文"),
+    (0x111E0, 0x111FF, "信德文"),
+    (0x11200, 0x1124F, "格兰塔文"),
+    (0x11280, 0x112AF, "古吉拉特文"),
+    (0x112B0, 0x112FF, "索拉什特拉文"),
+    (0x11300, 0x1137F, "泰米尔文"),
+    (0x11400, 0x1147F, "泰卢固文"),
+    (0x11480, 0x114DF, "埃塞俄比亚文扩展"),
+    (0x11580, 0x115FF, "悉昙文"),
+    (0x11600, 0x1165F, "蒙古文补充"),
+    (0x11660, 0x1167F, "加拿大原住民音节文字扩展"),
+    (0x11680, 0x116CF, "泰克里文"),
+    (0x11800, 0x1184F, "瓦郎奇蒂文"),
+    (0x118A0, 0x118FF, "万秋文"),
+    (0x11AC0, 0x11AFF, "蒲甘文"),
+    (0x11C00, 0x11C6F, "拜克舒基文"),
+    (0x11C70, 0x11CBF, "玛钦文"),
+    (0x12000, 0x123FF, "楔形文字"),
+    (0x12400, 0x1247F, "楔形文字数字和标点"),
+    (0x12480, 0x1254F, "早期王朝楔形文字"),
+    (0x13000, 0x1342F, "埃及圣书体"),
+    (0x13430, 0x1343F, "埃及圣书体格式控制"),
+    (0x14400, 0x1467F, "安纳托利亚象形文字"),
+    (0x16800, 0x16A3F, "巴姆穆文字补充"),
+    (0x16A40, 0x16A6F, "穆塔文"),
+    (0x16AD0, 0x16AFF, "巴萨瓦赫文"),
+    (0x16B00, 0x16B8F, "帕西安文"),
+    (0x16F00, 0x16F9F, "柏格理苗文"),
+    (0x16FE0, 0x16FFF, "表意符号和标点"),
+    (0x17000, 0x187FF, "中日韩统一表意文字扩展B"),
+    (0x18800, 0x18AFF, "中日韩统一表意文字扩展C"),
+    (0x1B000, 0x1B0FF, "日文假名补充"),
+    (0x1B100, 0x1B12F, "日文假名扩展-A"),
+    (0x1B170, 0x1B2FF, "女书"),
+    (0x1BC00, 0x1BC9F, "杜普洛伊速记"),
+    (0x1BCA0, 0x1BCAF, "格式控制符号的速记"),
+    (0x1D000, 0x1D0FF, "拜占庭音乐符号"),
+    (0x1D100, 0x1D1FF, "音乐符号"),
+    (0x1D200, 0x1D24F, "古希腊音乐记号"),
+    (0x1D300, 0x1D35F, "太玄经符号"),
+    (0x1D360, 0x1D37F, "算筹"),
+    (0x1D400, 0x1D7FF, "数学字母数字符号"),
+    (0x1E800, 0x1E8DF, "门德文"),
+    (0x1E900, 0x1E95F, "阿德拉姆文"),
+    (0x1EE00, 0x1EEFF, "阿拉伯数学字母符号"),
+    (0x1F000, 0x1F02F, "麻将牌"),
+    (0x1F030, 0x1F09F, "多米诺骨牌"),
+    (0x1F0A0, 0x1F0FF, "扑克牌"),
+    (0x1F100, 0x1F1FF, "带圈字母数字补充"),
+    (0x1F200, 0x1F2FF, "封闭式表意文字补充"),
+    (0x1F300, 0x1F5FF, "杂项符号和象形文字"),
+    (0x1F600, 0x1F64F, "表情符号"),
+    (0x1F650, 0x1F67F, "装饰符号"),
+    (0x1F680, 0x1F6FF, "交通和地图符号"),
+    (0x1F700, 0x1F77F, "炼金术符号"),
+    (0x1F780, 0x1F7FF, "几何图形扩展"),
+    (0x1F800, 0x1F8FF, "补充箭头-C"),
+    (0x1F900, 0x1F9FF, "补充符号和象形文字"),
+    (0x20000, 0x2A6DF, "中日韩统一表意文字扩展C"),
+    (0x2A700, 0x2B73F, "中日韩统一表意文字扩展D"),
+    (0x2B740, 0x2B81F, "中日韩统一表意文字扩展E"),
+    (0x2B820, 0x2CEAF, "中日韩统一表意文字扩展F"),
+    (0x2CEB0, 0x2EBEF, "中日韩统一表意文字扩展G"),
+    (0x2F800, 0x2FA1F, "中日韩兼容表意文字补充"),
+    (0xE0000, 0xE007F, "标签"),
+    (0xE0100, 0xE01EF, "变体选择符补充"),
+    (0xF0000, 0xFFFFF, "专用区（补充专用区）"),
+    (0x100000, 0x10FFFF, "辅助专用区"),
+])
+
+
+def _fill_block_gaps(blocks):
+    """在相邻区块之间的空隙插入“其他区块”，使区块表连续覆盖U+0000~U+10FFFF"""
+    filled = []
+    next_start = 0
+    for start, end, name in blocks:
+        if start > next_start:
+            filled.append((next_start, start - 1, "其他区块"))
+        filled.append((start, end, name))
+        next_start = end + 1
+    if next_start <= 0x10FFFF:
+        filled.append((next_start, 0x10FFFF, "其他区块"))
+    return filled
+
+
+# 按起始码点排列的并行数组，供bisect二分查找；由于区块表连续无空隙，查找时无需再检查区块结尾
+_FILLED_BLOCKS = _fill_block_gaps(_UNICODE_BLOCKS)
+_BLOCK_STARTS = tuple(b[0] for b in _FILLED_BLOCKS)
+_BLOCK_NAMES = tuple(b[2] for b in _FILLED_BLOCKS)
+
+# 输出表格的列，顺序与_extract_chunk的返回值一致
+_TABLE_COLUMNS = ("字符", "Unicode编码", "Unicode名称", "区块")
+
+# 基本多文种平面（U+0000~U+FFFF）的控制字符位图：类别以C开头的码点为1
+_IS_CONTROL_BMP = bytes([unicodedata.category(chr(cp))[0] == 'C' for cp in range(0x10000)])
+
+# 提取时每批处理的码点数，每批更新一次进度
+_PROGRESS_BATCH = 0x1000
+
+
+def _bisect_block(code_point):
+    """二分查找码点所属的区块"""
+    return _BLOCK_NAMES[bisect_right(_BLOCK_STARTS, code_point) - 1]
+
+
+@lru_cache(maxsize=None)
+def _block_for_bucket(bucket):
+    """若以128个码点为一组的分桶整体落在同一区块内，返回其区块名称，否则返回None"""
+    first = bucket << 7
+    i = bisect_right(_BLOCK_STARTS, first) - 1
+    if i == bisect_right(_BLOCK_STARTS, first | 0x7F) - 1:
+        return _BLOCK_NAMES[i]
+    return None  # 分桶内有新区块开始
+
+
+def _unicode_block(code_point):
+    """获取Unicode字符所属的区块（相邻码点几乎总在同一区块，先查分桶缓存）"""
+    return _block_for_bucket(code_point >> 7) or _bisect_block(code_point)
+
+
+def _iter_glyph_rows(code_points, include_control_chars, show_preview):
+    """逐个码点生成输出行：控制字符过滤、格式化和区块查找在同一次遍历中完成"""
+    _category = unicodedata.category
+    _name = unicodedata.name
+    for code_point in code_points:
+        char = chr(code_point)
+        control = _IS_CONTROL_BMP[code_point] if code_point < 0x10000 else _category(char)[0] == 'C'
+        if control and not include_control_chars:
+            continue
+        yield (
+            "□" if control and not show_preview else char,
+            "U+%04X" % code_point,
+            _name(char, "未命名字符"),
+            _unicode_block(code_point),
+        )
+
+
+def _extract_chunk(code_points, include_control_chars, show_preview):
+    """提取一组码点的字形信息，按_TABLE_COLUMNS的顺序返回各列（每行的内容由_iter_glyph_rows决定）"""
+    rows = list(_iter_glyph_rows(code_points, include_control_chars, show_preview))
+    if not rows:
+        return tuple([] for _ in _TABLE_COLUMNS)
+    # 将行转置为列
+    return tuple(map(list, zip(*rows)))
 
-try:
-    import openpyxl
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = True  # 非必需，仅用于Excel格式
 
 class FontToTableApp:
     def __init__(self, root):
@@ -56,12 +399,18 @@ class FontToTableApp:
         self.status_var = tk.StringVar(value="就绪")
         self.progress_var = tk.DoubleVar(value=0)
         
+        # 工作线程只写入以下属性，由主线程定时同步到界面（Tk不是线程安全的）
+        self._status = "就绪"
+        self._progress = 0
+        self._converting = False
+        
         # 支持的格式
         self.supported_font_formats = [
             ("TrueType 字体", "*.ttf"),
             ("OpenType 字体", "*.otf"),
             ("Web Open Font Format", "*.woff"),
             ("WOFF2 字体", "*.woff2"),
+            ("TrueType 字体集合", "*.ttc"),
             ("所有文件", "*.*")
         ]
         
@@ -210,7 +559,7 @@ class FontToTableApp:
         # 信息文本
         info_text = (
             "功能说明:\n"
-            "1. 选择字体文件（支持 .ttf, .otf, .woff, .woff2 格式）\n"
+            "1. 选择字体文件（支持 .ttf, .otf, .woff, .woff2, .ttc 格式）\n"
             "2. 选择输出表格格式（CSV, Excel, JSON, HTML, Markdown）\n"
             "3. 选择输出文件路径\n"
             "4. 点击'开始转换'按钮\n\n"
@@ -265,417 +614,138 @@ class FontToTableApp:
     
     def get_unicode_name(self, char):
         """获取Unicode字符的名称"""
-        try:
-            name = unicodedata.name(char)
-            return name
-        except ValueError:
-            return "未命名字符"
+        return unicodedata.name(char, "未命名字符")
     
     def get_unicode_block(self, code_point):
         """获取Unicode字符所属的区块"""
-        # Unicode区块范围定义（简化版，常用区块）
-        blocks = [
-            (0x0000, 0x007F, "基本拉丁文"),
-            (0x0080, 0x00FF, "拉丁文补充-1"),
-            (0x0100, 0x017F, "拉丁文扩展-A"),
-            (0x0180, 0x024F, "拉丁文扩展-B"),
-            (0x0370, 0x03FF, "希腊文及科普特文"),
-            (0x0400, 0x04FF, "西里尔文"),
-            (0x0500, 0x052F, "西里尔文补充"),
-            (0x0530, 0x058F, "亚美尼亚文"),
-            (0x0590, 0x05FF, "希伯来文"),
-            (0x0600, 0x06FF, "阿拉伯文"),
-            (0x0700, 0x074F, "叙利亚文"),
-            (0x0750, 0x077F, "阿拉伯文补充"),
-            (0x0780, 0x07BF, "它拿文"),
-            (0x0800, 0x083F, "撒马利亚文"),
-            (0x0840, 0x085F, "曼达文"),
-            (0x0860, 0x086F, "叙利亚文补充"),
-            (0x08A0, 0x08FF, "阿拉伯文扩展-A"),
-            (0x0900, 0x097F, "天城文"),
-            (0x0980, 0x09FF, "孟加拉文"),
-            (0x0A00, 0x0A7F, "古木基文"),
-            (0x0A80, 0x0AFF, "古吉拉特文"),
-            (0x0B00, 0x0B7F, "奥里亚文"),
-            (0x0B80, 0x0BFF, "泰米尔文"),
-            (0x0C00, 0x0C7F, "泰卢固文"),
-            (0x0C80, 0x0CFF, "卡纳达文"),
-            (0x0D00, 0x0D7F, "马拉雅拉姆文"),
-            (0x0D80, 0x0DFF, "僧伽罗文"),
-            (0x0E00, 0x0E7F, "泰文"),
-            (0x0E80, 0x0EFF, "老挝文"),
-            (0x0F00, 0x0FFF, "藏文"),
-            (0x1000, 0x109F, "缅甸文"),
-            (0x10A0, 0x10FF, "格鲁吉亚文"),
-            (0x1100, 0x11FF, "谚文兼容字母"),
-            (0x1200, 0x137F, "埃塞俄比亚文"),
-            (0x1380, 0x139F, "埃塞俄比亚文补充"),
-            (0x13A0, 0x13FF, "切罗基文"),
-            (0x1400, 0x167F, "统一加拿大原住民音节文字"),
-            (0x1680, 0x169F, "欧甘文"),
-            (0x16A0, 0x16FF, "如尼文"),
-            (0x1700, 0x171F, "塔加拉文"),
-            (0x1720, 0x173F, "哈努诺文"),
-            (0x1740, 0x175F, "布希德文"),
-            (0x1760, 0x177F, "塔格班瓦文"),
-            (0x1780, 0x17FF, "高棉文"),
-            (0x1800, 0x18AF, "蒙古文"),
-            (0x18B0, 0x18FF, "统一加拿大原住民音节文字扩展"),
-            (0x1900, 0x194F, "林布文"),
-            (0x1950, 0x197F, "德宏傣文"),
-            (0x1980, 0x19DF, "新傣仂文"),
-            (0x19E0, 0x19FF, "高棉符号"),
-            (0x1A00, 0x1A1F, "布吉文"),
-            (0x1A20, 0x1AAF, "兰纳文"),
-            (0x1AB0, 0x1AFF, "组合变音标记扩展"),
-            (0x1B00, 0x1B7F, "巴厘文"),
-            (0x1B80, 0x1BBF, "巽他文"),
-            (0x1BC0, 0x1BFF, "巴塔克文"),
-            (0x1C00, 0x1C4F, "雷布查文"),
-            (0x1C50, 0x1C7F, "桑塔利文"),
-            (0x1C80, 0x1C8F, "西里尔文扩展-C"),
-            (0x1C90, 0x1CBF, "格鲁吉亚文扩展"),
-            (0x1CC0, 0x1CCF, "巽他文补充"),
-            (0x1CD0, 0x1CFF, "吠陀扩展"),
-            (0x1D00, 0x1D7F, "音标扩展"),
-            (0x1D80, 0x1DBF, "音标扩展补充"),
-            (0x1DC0, 0x1DFF, "组合变音标记补充"),
-            (0x1E00, 0x1EFF, "拉丁文扩展附加"),
-            (0x1F00, 0x1FFF, "希腊文扩展"),
-            (0x2000, 0x206F, "常用标点"),
-            (0x2070, 0x209F, "上标和下标"),
-            (0x20A0, 0x20CF, "货币符号"),
-            (0x20D0, 0x20FF, "组合用符号"),
-            (0x2100, 0x214F, "字母式符号"),
-            (0x2150, 0x218F, "数字形式"),
-            (0x2190, 0x21FF, "箭头"),
-            (0x2200, 0x22FF, "数学运算符"),
-            (0x2300, 0x23FF, "杂项技术符号"),
-            (0x2400, 0x243F, "控制图片"),
-            (0x2440, 0x245F, "光学识别符"),
-            (0x2460, 0x24FF, "带圈字母数字"),
-            (0x2500, 0x257F, "制表符"),
-            (0x2580, 0x259F, "方块元素"),
-            (0x25A0, 0x25FF, "几何图形"),
-            (0x2600, 0x26FF, "杂项符号"),
-            (0x2700, 0x27BF, "印刷符号"),
-            (0x27C0, 0x27EF, "杂项数学符号-A"),
-            (0x27F0, 0x27FF, "补充箭头-A"),
-            (0x2800, 0x28FF, "盲文点字模型"),
-            (0x2900, 0x297F, "补充箭头-B"),
-            (0x2980, 0x29FF, "杂项数学符号-B"),
-            (0x2A00, 0x2AFF, "补充数学运算符"),
-            (0x2B00, 0x2BFF, "杂项符号和箭头"),
-            (0x2C00, 0x2C5F, "格拉哥里文"),
-            (0x2C60, 0x2C7F, "拉丁文扩展-C"),
-            (0x2C80, 0x2CFF, "科普特文"),
-            (0x2D00, 0x2D2F, "格鲁吉亚文补充"),
-            (0x2D30, 0x2D7F, "提非纳文"),
-            (0x2D80, 0x2DDF, "埃塞俄比亚文扩展"),
-            (0x2DE0, 0x2DFF, "西里尔文扩展-A"),
-            (0x2E00, 0x2E7F, "补充标点"),
-            (0x2E80, 0x2EFF, "中日韩汉字部首补充"),
-            (0x2F00, 0x2FDF, "康熙部首"),
-            (0x2FF0, 0x2FFF, "表意文字描述字符"),
-            (0x3000, 0x303F, "中日韩符号和标点"),
-            (0x3040, 0x309F, "日文平假名"),
-            (0x30A0, 0x30FF, "日文片假名"),
-            (0x3100, 0x312F, "注音字母"),
-            (0x3130, 0x318F, "谚文兼容字母"),
-            (0x3190, 0x319F, "汉文注释标志"),
-            (0x31A0, 0x31BF, "注音字母扩展"),
-            (0x31C0, 0x31EF, "中日韩笔画"),
-            (0x31F0, 0x31FF, "日文片假名拼音扩展"),
-            (0x3200, 0x32FF, "带圈中日韩字母和月份"),
-            (0x3300, 0x33FF, "中日韩兼容字符"),
-            (0x3400, 0x4DBF, "中日韩统一表意文字扩展A"),
-            (0x4DC0, 0x4DFF, "易经六十四卦符号"),
-            (0x4E00, 0x9FFF, "中日韩统一表意文字"),
-            (0xA000, 0xA48F, "彝文音节"),
-            (0xA490, 0xA4CF, "彝文字根"),
-            (0xA4D0, 0xA4FF, "老傈僳文"),
-            (0xA500, 0xA63F, "瓦伊文"),
-            (0xA640, 0xA69F, "西里尔文扩展-B"),
-            (0xA6A0, 0xA6FF, "巴穆姆文"),
-            (0xA700, 0xA71F, "声调修饰字母"),
-            (0xA720, 0xA7FF, "拉丁文扩展-D"),
-            (0xA800, 0xA82F, "锡尔赫特文"),
-            (0xA830, 0xA83F, "通用印度数字格式"),
-            (0xA840, 0xA87F, "八思巴文"),
-            (0xA880, 0xA8DF, "索拉什特拉文"),
-            (0xA8E0, 0xA8FF, "天城文扩展"),
-            (0xA900, 0xA92F, "克耶文"),
-            (0xA930, 0xA95F, "勒姜文"),
-            (0xA960, 0xA97F, "谚文扩展-A"),
-            (0xA980, 0xA9DF, "爪哇文"),
-            (0xA9E0, 0xA9FF, "缅甸文扩展-B"),
-            (0xAA00, 0xAA5F, "占文"),
-            (0xAA60, 0xAA7F, "缅甸文扩展-A"),
-            (0xAA80, 0xAADF, "越南傣文"),
-            (0xAAE0, 0xAAFF, "梅泰文扩展"),
-            (0xAB00, 0xAB2F, "埃塞俄比亚文扩展-A"),
-            (0xAB30, 0xAB6F, "拉丁文扩展-E"),
-            (0xAB70, 0xABBF, "切罗基文补充"),
-            (0xABC0, 0xABFF, "曼尼普尔文"),
-            (0xAC00, 0xD7AF, "谚文音节"),
-            (0xD7B0, 0xD7FF, "谚文字母扩展-B"),
-            (0xF900, 0xFAFF, "中日韩兼容表意文字"),
-            (0xFB00, 0xFB4F, "字母表达形式"),
-            (0xFB50, 0xFDFF, "阿拉伯表达形式-A"),
-            (0xFE00, 0xFE0F, "变体选择符"),
-            (0xFE10, 0xFE1F, "竖排形式"),
-            (0xFE20, 0xFE2F, "组合用半符号"),
-            (0xFE30, 0xFE4F, "中日韩兼容形式"),
-            (0xFE50, 0xFE6F, "小写变体形式"),
-            (0xFE70, 0xFEFF, "阿拉伯表达形式-B"),
-            (0xFF00, 0xFFEF, "半形及全形形式"),
-            (0xFFF0, 0xFFFF, "特殊"),
-            (0x10000, 0x1007F, "线性文字B音节文字"),
-            (0x10080, 0x100FF, "线性文字B表意文字"),
-            (0x10100, 0x1013F, "爱琴海数字"),
-            (0x10140, 0x1018F, "古希腊数字"),
-            (0x10190, 0x101CF, "古代符号"),
-            (0x101D0, 0x101FF, "费斯托斯圆盘"),
-            (0x10280, 0x1029F, "吕基亚文"),
-            (0x102A0, 0x102DF, "卡里亚文"),
-            (0x102E0, 0x102FF, "科普特历法"),
-            (0x10300, 0x1032F, "古意大利文"),
-            (0x10330, 0x1034F, "哥特文"),
-            (0x10350, 0x1037F, "古彼尔姆文"),
-            (0x10380, 0x1039F, "乌加里特文"),
-            (0x103A0, 0x103DF, "古波斯文"),
-            (0x10400, 0x1044F, "德瑟雷特文"),
-            (0x10450, 0x1047F, "肃伯纳文"),
-            (0x10480, 0x104AF, "奥斯曼亚文"),
-            (0x104B0, 0x104FF, "欧塞奇文"),
-            (0x10500, 0x1052F, "爱尔巴桑文"),
-            (0x10530, 0x1056F, "高加索阿尔巴尼亚文"),
-            (0x10600, 0x1077F, "线性文字A"),
-            (0x10800, 0x1083F, "塞浦路斯音节文字"),
-            (0x10840, 0x1085F, "帝国亚拉姆文"),
-            (0x10860, 0x1087F, "帕尔迈拉文"),
-            (0x10880, 0x108AF, "纳巴泰文"),
-            (0x108E0, 0x108FF, "哈特拉文"),
-            (0x10900, 0x1091F, "腓尼基文"),
-            (0x10920, 0x1093F, "吕底亚文"),
-            (0x10980, 0x1099F, "麦罗埃文圣书体"),
-            (0x109A0, 0x109FF, "麦罗埃文草书体"),
-            (0x10A00, 0x10A5F, "佉卢文"),
-            (0x10A60, 0x10A7F, "古南阿拉伯文"),
-            (0x10A80, 0x10A9F, "古北阿拉伯文"),
-            (0x10AC0, 0x10AFF, "曼尼安文"),
-            (0x10B00, 0x10B3F, "阿维斯陀文"),
-            (0x10B40, 0x10B5F, "碑铭帕提亚文"),
-            (0x10B60, 0x10B7F, "碑铭巴列维文"),
-            (0x10B80, 0x10BAF, "诗篇巴列维文"),
-            (0x10C00, 0x10C4F, "古突厥文"),
-            (0x10C80, 0x10CFF, "古匈牙利文"),
-            (0x10E60, 0x10E7F, "卢米符号数字"),
-            (0x11000, 0x1107F, "婆罗米文"),
-            (0x11080, 0x110CF, "凯提文"),
-            (0x110D0, 0x110FF, "索拉桑朋文"),
-            (0x11100, 0x1114F, "查克马文"),
-            (0x11150, 0x1117F, "马哈贾尼文"),
-            (0x11180, 0x111DF, "夏拉达文"),
-            (0x111E0, 0x111FF, "信德文"),
-            (0x11200, 0x1124F, "格兰塔文"),
-            (0x11280, 0x112AF, "古吉拉特文"),
-            (0x112B0, 0x112FF, "索拉什特拉文"),
-            (0x11300, 0x1137F, "泰米尔文"),
-            (0x11400, 0x1147F, "泰卢固文"),
-            (0x11480, 0x114DF, "埃塞俄比亚文扩展"),
-            (0x11580, 0x115FF, "悉昙文"),
-            (0x11600, 0x1165F, "蒙古文补充"),
-            (0x11660, 0x1167F, "加拿大原住民音节文字扩展"),
-            (0x11680, 0x116CF, "泰克里文"),
-            (0x11800, 0x1184F, "瓦郎奇蒂文"),
-            (0x118A0, 0x118FF, "万秋文"),
-            (0x11AC0, 0x11AFF, "蒲甘文"),
-            (0x11C00, 0x11C6F, "拜克舒基文"),
-            (0x11C70, 0x11CBF, "玛钦文"),
-            (0x12000, 0x123FF, "楔形文字"),
-            (0x12400, 0x1247F, "楔形文字数字和标点"),
-            (0x12480, 0x1254F, "早期王朝楔形文字"),
-            (0x13000, 0x1342F, "埃及圣书体"),
-            (0x13430, 0x1343F, "埃及圣书体格式控制"),
-            (0x14400, 0x1467F, "安纳托利亚象形文字"),
-            (0x16800, 0x16A3F, "巴姆穆文字补充"),
-            (0x16A40, 0x16A6F, "穆塔文"),
-            (0x16AD0, 0x16AFF, "巴萨瓦赫文"),
-            (0x16B00, 0x16B8F, "帕西安文"),
-            (0x16F00, 0x16F9F, "柏格理苗文"),
-            (0x16FE0, 0x16FFF, "表意符号和标点"),
-            (0x17000, 0x187FF, "中日韩统一表意文字扩展B"),
-            (0x18800, 0x18AFF, "中日韩统一表意文字扩展C"),
-            (0x1B000, 0x1B0FF, "日文假名补充"),
-            (0x1B100, 0x1B12F, "日文假名扩展-A"),
-            (0x1B170, 0x1B2FF, "女书"),
-            (0x1BC00, 0x1BC9F, "杜普洛伊速记"),
-            (0x1BCA0, 0x1BCAF, "格式控制符号的速记"),
-            (0x1D000, 0x1D0FF, "拜占庭音乐符号"),
-            (0x1D100, 0x1D1FF, "音乐符号"),
-            (0x1D200, 0x1D24F, "古希腊音乐记号"),
-            (0x1D300, 0x1D35F, "太玄经符号"),
-            (0x1D360, 0x1D37F, "算筹"),
-            (0x1D400, 0x1D7FF, "数学字母数字符号"),
-            (0x1E800, 0x1E8DF, "门德文"),
-            (0x1E900, 0x1E95F, "阿德拉姆文"),
-            (0x1EE00, 0x1EEFF, "阿拉伯数学字母符号"),
-            (0x1F000, 0x1F02F, "麻将牌"),
-            (0x1F030, 0x1F09F, "多米诺骨牌"),
-            (0x1F0A0, 0x1F0FF, "扑克牌"),
-            (0x1F100, 0x1F1FF, "带圈字母数字补充"),
-            (0x1F200, 0x1F2FF, "封闭式表意文字补充"),
-            (0x1F300, 0x1F5FF, "杂项符号和象形文字"),
-            (0x1F600, 0x1F64F, "表情符号"),
-            (0x1F650, 0x1F67F, "装饰符号"),
-            (0x1F680, 0x1F6FF, "交通和地图符号"),
-            (0x1F700, 0x1F77F, "炼金术符号"),
-            (0x1F780, 0x1F7FF, "几何图形扩展"),
-            (0x1F800, 0x1F8FF, "补充箭头-C"),
-            (0x1F900, 0x1F9FF, "补充符号和象形文字"),
-            (0x20000, 0x2A6DF, "中日韩统一表意文字扩展C"),
-            (0x2A700, 0x2B73F, "中日韩统一表意文字扩展D"),
-            (0x2B740, 0x2B81F, "中日韩统一表意文字扩展E"),
-            (0x2B820, 0x2CEAF, "中日韩统一表意文字扩展F"),
-            (0x2CEB0, 0x2EBEF, "中日韩统一表意文字扩展G"),
-            (0x2F800, 0x2FA1F, "中日韩兼容表意文字补充"),
-            (0xE0000, 0xE007F, "标签"),
-            (0xE0100, 0xE01EF, "变体选择符补充"),
-            (0xF0000, 0xFFFFF, "专用区（补充专用区）"),
-            (0x100000, 0x10FFFF, "辅助专用区"),
-        ]
-        
-        for start, end, name in blocks:
-            if start <= code_point <= end:
-                return name
-        
-        return "其他区块"
+        return _unicode_block(code_point)
     
-    def extract_font_glyphs(self, font_path, include_control_chars=False, show_preview=True):
-        """从字体文件中提取字形信息"""
+    def load_code_points(self, font_path):
+        """读取字体文件中已定义字形的Unicode码点，按码点升序返回"""
         if not FONTTOOLS_AVAILABLE:
             raise ImportError("fontTools库未安装，请运行: pip install fonttools")
         
-        if not PANDAS_AVAILABLE:
-            raise ImportError("pandas库未安装，请运行: pip install pandas")
+        from fontTools.ttLib import TTFont
         
-        self.status_var.set("正在加载字体文件...")
-        self.progress_var.set(10)
-        self.root.update()
+        self._status = "正在加载字体文件..."
+        self._progress = 10
         
         try:
-            font = TTFont(font_path)
+            # 延迟解析各表，只有实际访问的cmap表才会被解码；字体集合（.ttc）读取第一个字体
+            font = TTFont(font_path, lazy=True, recalcBBoxes=False, recalcTimestamp=False, fontNumber=0)
         except Exception as e:
             raise Exception(f"无法加载字体文件: {e}")
         
-        self.status_var.set("正在提取字形信息...")
-        self.progress_var.set(30)
-        self.root.update()
-        
-        glyphs_data = []
+        self._status = "正在提取字形信息..."
+        self._progress = 30
         
         # 获取cmap表（字符映射表）
         if 'cmap' not in font:
             raise Exception("字体文件不包含cmap表（字符映射表）")
         
-        cmap = font.getBestCmap()
+        # 只需要已定义的码点：直接取最优Unicode子表自身的映射（不复制），且只读取其键
+        cmap = font['cmap'].getBestCmap()
         
         if not cmap:
             raise Exception("无法从字体文件中提取字符映射")
         
-        total_glyphs = len(cmap)
-        processed = 0
-        
-        for code_point, glyph_name in cmap.items():
-            try:
-                # 更新进度
-                processed += 1
-                progress = 30 + (processed / total_glyphs) * 60
-                self.progress_var.set(progress)
-                
-                if processed % 100 == 0:
-                    self.status_var.set(f"正在处理字符: {processed}/{total_glyphs}")
-                    self.root.update()
-                
-                # 将Unicode码点转换为字符
-                char = chr(code_point)
-                
-                # 如果不包含控制字符且当前字符是控制字符，则跳过
-                if not include_control_chars and unicodedata.category(char).startswith('C'):
-                    continue
-                
-                # 如果不显示预览，将控制字符替换为占位符
-                display_char = char
-                if not show_preview and unicodedata.category(char).startswith('C'):
-                    display_char = "□"  # 用方框表示控制字符
-                
-                # 获取Unicode名称
-                unicode_name = self.get_unicode_name(char)
-                
-                # 获取Unicode区块
-                unicode_block = self.get_unicode_block(code_point)
-                
-                # 格式化Unicode码点
-                unicode_hex = f"U+{code_point:04X}"
-                
-                # 添加到数据列表
-                glyphs_data.append({
-                    "字符": display_char,
-                    "Unicode编码": unicode_hex,
-                    "Unicode名称": unicode_name,
-                    "区块": unicode_block,
-                    "十进制码点": code_point,
-                    "字符类别": unicodedata.category(char)
-                })
-                
-            except Exception as e:
-                # 跳过无法处理的字符
-                continue
+        # 提取前先按码点排序一次，后续各列即为有序结果，保存时无需再排序；
+        # 码点以紧凑的int数组保存（每个4字节）
+        code_points = array('i', sorted(cmap.keys()))
+        del cmap
         
         font.close()
         
-        self.status_var.set(f"成功提取 {len(glyphs_data)} 个字符")
-        self.progress_var.set(95)
-        self.root.update()
+        return code_points
+    
+    def extract_font_glyphs(self, font_path, include_control_chars=False, show_preview=True):
+        """从字体文件中提取字形信息"""
+        code_points = self.load_code_points(font_path)
+        
+        total_glyphs = len(code_points)
+        self._status = f"正在处理字符: {total_glyphs} 个"
+        
+        # 分批提取并追加到各列，每批结束时才记录一次进度，而不是每个字形一次
+        glyphs_data = {name: [] for name in _TABLE_COLUMNS}
+        columns = [glyphs_data[name] for name in _TABLE_COLUMNS]
+        for start in range(0, total_glyphs, _PROGRESS_BATCH):
+            end = start + _PROGRESS_BATCH
+            chunk = _extract_chunk(code_points[start:end], include_control_chars, show_preview)
+            for column, values in zip(columns, chunk):
+                column.extend(values)
+            self._progress = 30 + (min(end, total_glyphs) / total_glyphs) * 60
+        
+        self._status = f"成功提取 {len(glyphs_data['字符'])} 个字符"
+        self._progress = 95
         
         return glyphs_data
     
+    def stream_csv(self, font_path, output_path, include_control_chars=False, show_preview=True):
+        """边提取边写入CSV文件，不在内存中保留整张表，返回写入的字符数"""
+        code_points = self.load_code_points(font_path)
+        total_glyphs = len(code_points)
+        
+        self._status = f"正在处理并写入字符: {total_glyphs} 个"
+        count = 0
+        with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(_TABLE_COLUMNS)
+            writerow = writer.writerow
+            for count, row in enumerate(_iter_glyph_rows(code_points, include_control_chars, show_preview), 1):
+                writerow(row)
+                if not count & (_PROGRESS_BATCH - 1):
+                    self._progress = 30 + (count / total_glyphs) * 65
+        
+        return count
+    
     def save_table(self, data, output_path, table_format):
         """保存数据为表格文件"""
-        self.status_var.set(f"正在保存为{table_format.upper()}文件...")
-        self.root.update()
-        
-        # 创建DataFrame
-        df = pd.DataFrame(data)
+        self._status = f"正在保存为{table_format.upper()}文件..."
         
-        # 按Unicode编码排序
-        df = df.sort_values("十进制码点").reset_index(drop=True)
+        # 提取结果已按Unicode编码排序，直接逐行读取各列
+        def iter_rows():
+            return zip(*(data[name] for name in _TABLE_COLUMNS))
         
-        # 删除临时列
-        df = df.drop(columns=["十进制码点", "字符类别"])
-        
-        # 根据格式保存
+        # 根据格式保存（除Excel外均逐行写出，无需构建DataFrame）
         if table_format == "csv":
-            df.to_csv(output_path, index=False, encoding='utf-8-sig')
+            with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(_TABLE_COLUMNS)
+                writer.writerows(iter_rows())
         
         elif table_format == "xlsx":
-            if not OPENPYXL_AVAILABLE:
-                # 尝试安装openpyxl或使用其他引擎
-                try:
-                    df.to_excel(output_path, index=False, engine='openpyxl')
-                except:
-                    # 如果没有openpyxl，尝试使用xlwt（仅支持.xls）
-                    output_path = output_path.replace('.xlsx', '.xls')
-                    df.to_excel(output_path, index=False, engine='xlwt')
+            if OPENPYXL_AVAILABLE:
+                import openpyxl
+                
+                # 只写模式逐行写入工作表，不在内存中保留全部单元格对象
+                workbook = openpyxl.Workbook(write_only=True)
+                sheet = workbook.create_sheet("Sheet1")
+                sheet.append(_TABLE_COLUMNS)
+                for row in iter_rows():
+                    sheet.append(row)
+                workbook.save(output_path)
             else:
-                df.to_excel(output_path, index=False, engine='openpyxl')
+                # 如果没有openpyxl，尝试使用pandas和xlwt（仅支持.xls）
+                if not PANDAS_AVAILABLE:
+                    raise ImportError("openpyxl库未安装，请运行: pip install openpyxl")
+                import pandas as pd
+                
+                df = pd.DataFrame(data, columns=_TABLE_COLUMNS)
+                output_path = output_path.replace('.xlsx', '.xls')
+                df.to_excel(output_path, index=False, engine='xlwt')
         
         elif table_format == "json":
-            df.to_json(output_path, orient='records', force_ascii=False, indent=2)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write('[')
+                for i, row in enumerate(iter_rows()):
+                    record = json.dumps(dict(zip(_TABLE_COLUMNS, row)), ensure_ascii=False, indent=2)
+                    f.write(',\n  ' if i else '\n  ')
+                    f.write(record.replace('\n', '\n  '))
+                f.write('\n]')
         
         elif table_format == "html":
-            html_table = df.to_html(index=False, classes='font-glyphs-table')
+            # 逐行写出表格，避免在内存中拼接整张表的HTML字符串
+            header_cells = "".join(f"<th>{html.escape(name)}</th>" for name in _TABLE_COLUMNS)
             with open(output_path, 'w', encoding='utf-8') as f:
                 f.write(f"""<!DOCTYPE html>
 <html>
@@ -693,12 +763,27 @@ class FontToTableApp:
 <body>
     <h1>字体字形表</h1>
     <p>生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-    {html_table}
+    <table class="font-glyphs-table">
+      <thead>
+        <tr>{header_cells}</tr>
+      </thead>
+      <tbody>
+""")
+                for row in iter_rows():
+                    # 转义单元格内容，避免字符或名称中的<、&等破坏页面结构
+                    f.write("        <tr>" + "".join(f"<td>{html.escape(value)}</td>" for value in row) + "</tr>\n")
+                f.write("""      </tbody>
+    </table>
 </body>
 </html>""")
         
         elif table_format == "md":
-            df.to_markdown(output_path, index=False)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write("| " + " | ".join(_TABLE_COLUMNS) + " |\n")
+                f.write("|" + "---|" * len(_TABLE_COLUMNS) + "\n")
+                for row in iter_rows():
+                    # 转义单元格中的竖线，避免破坏表格结构
+                    f.write("| " + " | ".join(str(value).replace("|", "\\|") for value in row) + " |\n")
         
         else:
             raise ValueError(f"不支持的表格格式: {table_format}")
@@ -710,10 +795,6 @@ class FontToTableApp:
             messagebox.showerror("错误", "fontTools库未安装，请运行: pip install fonttools")
             return
         
-        if not PANDAS_AVAILABLE:
-            messagebox.showerror("错误", "pandas库未安装，请运行: pip install pandas")
-            return
-        
         # 检查输入文件
         font_path = self.font_path.get()
         if not font_path or not os.path.exists(font_path):
@@ -739,6 +820,10 @@ class FontToTableApp:
         self.convert_button.config(state=tk.DISABLED)
         self.status_var.set("开始处理...")
         self.progress_var.set(0)
+        self._status = "开始处理..."
+        self._progress = 0
+        self._converting = True
+        self.root.after(100, self._pump_progress)
         
         # 在新线程中执行转换
         thread = threading.Thread(
@@ -751,29 +836,37 @@ class FontToTableApp:
     def convert_thread(self, font_path, output_path):
         """转换线程"""
         try:
-            # 提取字形数据
-            glyphs_data = self.extract_font_glyphs(
-                font_path,
-                self.include_control_chars.get(),
-                self.show_preview.get()
-            )
-            
-            if not glyphs_data:
-                self.root.after(0, lambda: messagebox.showwarning("警告", "未找到可提取的字符"))
-                return
-            
-            # 保存表格
             table_format = self.table_format.get()
-            self.save_table(glyphs_data, output_path, table_format)
+            include_control_chars = self.include_control_chars.get()
+            show_preview = self.show_preview.get()
+            
+            if table_format == "csv":
+                # CSV无需整表数据，提取与写入合并为一次流式遍历
+                glyph_count = self.stream_csv(font_path, output_path, include_control_chars, show_preview)
+                if not glyph_count:
+                    os.remove(output_path)
+                    self.root.after(0, lambda: messagebox.showwarning("警告", "未找到可提取的字符"))
+                    return
+            else:
+                # 提取字形数据
+                glyphs_data = self.extract_font_glyphs(font_path, include_control_chars, show_preview)
+                
+                glyph_count = len(glyphs_data["字符"])
+                if not glyph_count:
+                    self.root.after(0, lambda: messagebox.showwarning("警告", "未找到可提取的字符"))
+                    return
+                
+                # 保存表格
+                self.save_table(glyphs_data, output_path, table_format)
             
             # 更新状态
-            self.progress_var.set(100)
-            self.status_var.set(f"转换完成！共提取 {len(glyphs_data)} 个字符")
+            self._progress = 100
+            self._status = f"转换完成！共提取 {glyph_count} 个字符"
             
             # 显示成功消息
             self.root.after(0, lambda: messagebox.showinfo(
                 "成功", 
-                f"转换完成！\n共提取 {len(glyphs_data)} 个字符\n文件已保存到: {output_path}"
+                f"转换完成！\n共提取 {glyph_count} 个字符\n文件已保存到: {output_path}"
             ))
             
         except Exception as e:
@@ -782,7 +875,16 @@ class FontToTableApp:
         finally:
             # 重新启用转换按钮
             self.root.after(0, lambda: self.convert_button.config(state=tk.NORMAL))
-            self.progress_var.set(0)
+            self._progress = 0
+            self._converting = False
+    
+    def _pump_progress(self):
+        """在主线程中将工作线程记录的进度和状态同步到界面，每100毫秒一次"""
+        converting = self._converting
+        self.progress_var.set(self._progress)
+        self.status_var.set(self._status)
+        if converting:
+            self.root.after(100, self._pump_progress)
     
     def preview_font(self):
         """预览字体"""
@@ -862,10 +964,10 @@ Font Preview: 字体预览"""
 def main():
     """主函数"""
     # 检查必要库
-    if not FONTTOOLS_AVAILABLE or not PANDAS_AVAILABLE:
+    if not FONTTOOLS_AVAILABLE:
         print("错误: 缺少必要的库")
         print("请运行以下命令安装所需库:")
-        print("pip install fonttools pandas")
+        print("pip install fonttools")
         if not OPENPYXL_AVAILABLE:
             print("pip install openpyxl  # 用于Excel文件支持")
         return